@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import os
 from collections import defaultdict
+from functools import lru_cache
 
 import pandas as pd
 from ahocorasick import Automaton
@@ -28,6 +30,26 @@ def init_automaton(scheme_fasta):
     return A
 
 
+def get_automaton(scheme_fasta: str) -> Automaton:
+    """Get the Aho-Corasick Automaton for a SNV scheme fasta, building it only once per process
+
+    Automatons are cached on the scheme fasta path and modification time so that changes to a user-specified scheme
+    fasta are picked up. The returned Automaton is shared and should not be modified.
+
+    Args:
+        scheme_fasta: SNV scheme fasta file path
+
+    Returns:
+         Aho-Corasick Automaton with kmers loaded
+    """
+    return _cached_automaton(scheme_fasta, os.stat(scheme_fasta).st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _cached_automaton(scheme_fasta: str, mtime_ns: int) -> Automaton:
+    return init_automaton(scheme_fasta)
+
+
 def find_in_fasta(automaton: Automaton, fasta: str) -> pd.DataFrame:
     """Find scheme kmers in input fasta file
 
@@ -3,12 +3,14 @@
 
 import argparse
 import logging
+import math
 import os
 import re
 import sys
-from typing import Optional, List, Any, Tuple
+from contextlib import ExitStack
+from functools import partial
+from typing import Optional, List, Any, Tuple, Iterator, Iterable, Callable, Union
 
-import attr
 import pandas as pd
 from pkg_resources import resource_filename
 from rich.logging import RichHandler
@@ -16,11 +18,8 @@ from rich.logging import RichHandler
 from bio_hansel import program_desc, __version__, program_name
 from bio_hansel.const import SUBTYPE_SUMMARY_COLS, REGEX_FASTQ, REGEX_FASTA, JSON_EXT_TMPL
 from bio_hansel.metadata import read_metadata_table, merge_results_with_metadata
-from bio_hansel.subtype import Subtype
 from bio_hansel.subtype_stats import subtype_counts
-from bio_hansel.subtyper import \
-    subtype_contigs_samples, \
-    subtype_reads_samples
+from bio_hansel.subtyper import subtype_samples
 import bio_hansel.utils
 
 SCRIPT_NAME = 'hansel'
@@ -43,6 +42,40 @@ def init_console_logger(logging_verbosity=3):
                                               tracebacks_show_locals=True)])
 
 
+def check_range(value_type: Callable[[str], Union[int, float]],
+                lo: Union[int, float],
+                hi: Union[int, float],
+                value: str) -> Union[int, float]:
+    """Convert a command-line argument value and check that it is within an inclusive range
+
+    Meant to be bound with `functools.partial` and used as an argparse argument `type`.
+
+    Args:
+        value_type: Type to convert the argument value to (e.g. `int`, `float`)
+        lo: Minimum allowed value
+        hi: Maximum allowed value
+        value: Command-line argument value
+
+    Returns:
+        Converted argument value
+
+    Raises:
+        argparse.ArgumentTypeError: if the value cannot be converted or is outside of the range
+    """
+    try:
+        x = value_type(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'invalid {value_type.__name__} value: "{value}"')
+    if not lo <= x <= hi:
+        raise argparse.ArgumentTypeError(f'{value} is not in range [{lo}, {hi}]')
+    return x
+
+
+proportion = partial(check_range, float, 0.0, 1.0)
+non_negative_int = partial(check_range, int, 0, math.inf)
+positive_int = partial(check_range, int, 1, math.inf)
+
+
 def init_parser():
     parser = argparse.ArgumentParser(prog=SCRIPT_NAME,
                                      formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -91,39 +124,39 @@ def init_parser():
                         action='store_true',
                         help='Output JSON representation of output files')
     parser.add_argument('--min-kmer-freq',
-                        type=int,
+                        type=non_negative_int,
                         help='Min k-mer freq/coverage')
     parser.add_argument('--min-kmer-frac',
-                        type=float,
+                        type=proportion,
                         help='Proportion of k-mer required for detection (0.0 - 1)')
     parser.add_argument('--max-kmer-freq',
-                        type=int,
+                        type=non_negative_int,
                         help='Max k-mer freq/coverage')
     parser.add_argument('--low-cov-depth-freq',
-                        type=int,
+                        type=non_negative_int,
                         help='Frequencies below this coverage are considered low coverage')
     parser.add_argument('--max-missing-kmers',
-                        type=float,
+                        type=proportion,
                         help='Decimal proportion of maximum allowable missing'
                              ' kmers before being considered an error. '
                              '(0.0 - 1.0)')
     parser.add_argument('--min-ambiguous-kmers',
-                        type=int,
+                        type=non_negative_int,
                         help='Minimum number of missing kmers to be considered an ambiguous result')
     parser.add_argument('--low-cov-warning',
-                        type=int,
+                        type=non_negative_int,
                         help='Overall kmer coverage below this value will trigger a low coverage warning')
     parser.add_argument('--max-intermediate-kmers',
-                        type=float,
+                        type=proportion,
                         help='Decimal proportion of maximum allowable '
                              'missing kmers to be considered an '
                              'intermediate subtype. (0.0 - 1.0)')
     parser.add_argument('--max-degenerate-kmers',
-                        type=int,
+                        type=non_negative_int,
                         help='Maximum number of scheme k-mers allowed before '
                              'quitting with a usage warning. Default is 100000')
     parser.add_argument('-t', '--threads',
-                        type=int,
+                        type=positive_int,
                         default=1,
                         help='Number of parallel threads to run analysis (default=1)')
     parser.add_argument('-v', '--verbose',
@@ -193,12 +226,104 @@ def collect_inputs(args: Any) -> Tuple[List[Tuple[str, str]], List[Tuple[List[st
     return input_genomes, reads
 
 
+def kmer_results_tables(dfs: List[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Prepare each sample's detailed k-mer results table for output
+
+    Tables are conformed to the union of the columns of all tables (in order of first appearance) so that they can be
+    written out one after the other without first being concatenated into a single table.
+
+    Args:
+        dfs: Detailed k-mer subtyping results for each sample
+
+    Yields:
+        k-mer results table for each sample with positive k-mer results first
+    """
+    columns = []
+    for df in dfs:
+        columns += [x for x in df.columns if x not in columns]
+    # Error message is redundant accross each of the k-mers
+    columns = [x for x in columns if x != 'qc_message']
+    for df in dfs:
+        df = df.sort_values('is_pos_kmer', ascending=False).reindex(columns=columns)
+        yield bio_hansel.utils.df_field_fillna(df)
+
+
+def write_tables(dfs: Iterable[pd.DataFrame],
+                 path: str,
+                 json_path: Optional[str] = None,
+                 **kwargs_for_pd_to_table) -> None:
+    """Write tables with the same columns one after the other to a single table file and optionally a JSON file
+
+    The JSON output is a single array of the records of all tables.
+
+    Args:
+        dfs: Tables to write
+        path: Output table file path
+        json_path: Optional output JSON file path
+        **kwargs_for_pd_to_table: Keyword arguments for `pd.DataFrame.to_csv`
+    """
+    with ExitStack() as stack:
+        fh = stack.enter_context(open(path, 'w'))
+        fh_json = stack.enter_context(open(json_path, 'w')) if json_path else None
+        if fh_json is not None:
+            fh_json.write('[')
+        sep = ''
+        for i, df in enumerate(dfs):
+            df.to_csv(fh, header=(i == 0), **kwargs_for_pd_to_table)
+            if fh_json is not None:
+                records = df.to_json(orient='records')[1:-1]
+                if records:
+                    fh_json.write(sep)
+                    fh_json.write(records)
+                    sep = ','
+        if fh_json is not None:
+            fh_json.write(']')
+
+
+def simple_summary(dfsummary: pd.DataFrame,
+                   summary_columns: List[str],
+                   df_md: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Get the simple summary as a projection of the summary results
+
+    Metadata is expected to already be merged into `dfsummary`. Metadata and summary columns sharing a name are
+    given "_x"/"_y" suffixes by that merge, so columns are selected by their merged names and renamed to what they
+    would be named if the metadata was merged into the simple summary columns alone.
+
+    Args:
+        dfsummary: Summary results with subtype metadata merged in if `df_md` is not `None`
+        summary_columns: Summary results columns before merging with subtype metadata
+        df_md: Subtype metadata table
+
+    Returns:
+        Simple summary results with subtype metadata
+    """
+    simple_summary_cols = ['sample', 'subtype']
+    if 'avg_kmer_coverage' in summary_columns:
+        simple_summary_cols.append('avg_kmer_coverage')
+    simple_summary_cols += ['qc_status', 'qc_message']
+    if df_md is None:
+        return dfsummary[simple_summary_cols]
+    md_cols = [x for x in df_md.columns if x != 'subtype']
+    merged_to_simple = {}
+    for x in simple_summary_cols:
+        name = f'{x}_x' if x in md_cols else x
+        merged_to_simple[name] = name
+    for x in md_cols:
+        merged_to_simple[f'{x}_y' if x in summary_columns else x] = f'{x}_y' if x in simple_summary_cols else x
+    return dfsummary[list(merged_to_simple)].rename(columns=merged_to_simple)
+
+
 def main():
     parser = init_parser()
     if len(sys.argv[1:]) == 0:
         parser.print_help()
         parser.exit()
     args = parser.parse_args()
+    subtyping_params = bio_hansel.utils.init_subtyping_params(args, args.scheme)
+    try:
+        bio_hansel.utils.check_kmer_freq_thresholds(subtyping_params)
+    except ValueError as e:
+        parser.error(str(e))
     init_console_logger(args.verbose)
     output_summary_path = args.output_summary
     output_kmer_results = args.output_kmer_results
@@ -206,16 +331,15 @@ def main():
     bio_hansel.utils.does_file_exist(output_simple_summary_path, args.force)
     bio_hansel.utils.does_file_exist(output_summary_path, args.force)
     bio_hansel.utils.does_file_exist(output_kmer_results, args.force)
-    scheme: str = args.scheme
-    scheme_name: Optional[str] = args.scheme_name
-    scheme_fasta = bio_hansel.utils.get_scheme_fasta(scheme)
-    scheme_subtype_counts = subtype_counts(scheme_fasta)
     logging.debug(args)
-    subtyping_params = bio_hansel.utils.init_subtyping_params(args, scheme)
-    bio_hansel.utils.check_total_kmers(scheme_fasta, subtyping_params.max_degenerate_kmers)
     input_contigs, input_reads = collect_inputs(args)
     if len(input_contigs) == 0 and len(input_reads) == 0:
         raise Exception('No input files specified!')
+    scheme: str = args.scheme
+    scheme_name: Optional[str] = args.scheme_name
+    scheme_fasta = bio_hansel.utils.get_scheme_fasta(scheme)
+    bio_hansel.utils.check_total_kmers(scheme_fasta, subtyping_params.max_degenerate_kmers)
+    scheme_subtype_counts = subtype_counts(scheme_fasta)
 
     df_md = None
     md_path = resource_filename(program_name, f'data/{scheme}/metadata.tsv')
@@ -231,36 +355,28 @@ def main():
 
     n_threads = args.threads
 
-    subtype_results: List[Tuple[Subtype, pd.DataFrame]] = []
-    if len(input_contigs) > 0:
-        contigs_results = subtype_contigs_samples(input_genomes=input_contigs,
-                                                  scheme=scheme,
-                                                  scheme_name=scheme_name,
-                                                  subtyping_params=subtyping_params,
-                                                  scheme_subtype_counts=scheme_subtype_counts,
-                                                  n_threads=n_threads)
-        logging.info('Generated %s subtyping results from %s contigs samples', len(contigs_results), len(input_contigs))
-        subtype_results += contigs_results
-    if len(input_reads) > 0:
-        reads_results = subtype_reads_samples(reads=input_reads,
-                                              scheme=scheme,
-                                              scheme_name=scheme_name,
-                                              subtyping_params=subtyping_params,
-                                              scheme_subtype_counts=scheme_subtype_counts,
-                                              n_threads=n_threads)
-        logging.info('Generated %s subtyping results from %s contigs samples', len(reads_results), len(input_reads))
-        subtype_results += reads_results
+    subtype_results = subtype_samples(input_genomes=input_contigs,
+                                      reads=input_reads,
+                                      scheme=scheme,
+                                      scheme_name=scheme_name,
+                                      subtyping_params=subtyping_params,
+                                      scheme_subtype_counts=scheme_subtype_counts,
+                                      n_threads=n_threads)
+    logging.info('Generated %s subtyping results from %s contigs samples and %s reads samples',
+                 len(subtype_results),
+                 len(input_contigs),
+                 len(input_reads))
 
     dfs: List[pd.DataFrame] = [df for st, df in subtype_results]
-    dfsummary = pd.DataFrame([attr.asdict(st) for st, df in subtype_results])
-
-    dfsummary = dfsummary[SUBTYPE_SUMMARY_COLS]
+    dfsummary = pd.DataFrame({col: [getattr(st, col) for st, _ in subtype_results] for col in SUBTYPE_SUMMARY_COLS},
+                             columns=SUBTYPE_SUMMARY_COLS)
 
     if dfsummary['avg_kmer_coverage'].isnull().all():
         dfsummary = dfsummary.drop(labels='avg_kmer_coverage', axis=1)
 
     dfsummary = bio_hansel.utils.df_field_fillna(dfsummary)
 
+    summary_columns = list(dfsummary.columns)
     if df_md is not None:
         dfsummary = merge_results_with_metadata(dfsummary, df_md)
 
@@ -274,33 +390,20 @@ def main():
         logging.info('Wrote subtyping output summary to %s', output_summary_path)
     else:
         # if no output path specified for the summary results, then print to stdout
-        print(dfsummary.to_csv(sep='\t', index=False))
+        dfsummary.to_csv(sys.stdout, sep='\t', index=False)
 
     if output_kmer_results:
         if dfs:
-            dfall: pd.DataFrame = pd.concat([df.sort_values('is_pos_kmer', ascending=False) for df in dfs], sort=False)
-            # Error message is redundant accross each of the k-mers
-            dfall = dfall.drop(columns=['qc_message'])
-            dfall = bio_hansel.utils.df_field_fillna(dfall)
-            dfall.to_csv(output_kmer_results, **kwargs_for_pd_to_table)
-            logging.info('Kmer results written to "{}".'.format(output_kmer_results))
-            if args.json:
-                dfall.to_json(JSON_EXT_TMPL.format(output_kmer_results), **kwargs_for_pd_to_json)
-                logging.info(
-                    'Kmer results written to "{}" in JSON format.'.format(JSON_EXT_TMPL.format(output_kmer_results)))
+            json_path = JSON_EXT_TMPL.format(output_kmer_results) if args.json else None
+            write_tables(kmer_results_tables(dfs), output_kmer_results, json_path, **kwargs_for_pd_to_table)
+            logging.info('Kmer results written to "%s".', output_kmer_results)
+            if json_path:
+                logging.info('Kmer results written to "%s" in JSON format.', json_path)
         else:
-            logging.error(
-                'No kmer results generated. No kmer results file written to "{}".'.format(output_kmer_results))
+            logging.error('No kmer results generated. No kmer results file written to "%s".', output_kmer_results)
 
     if output_simple_summary_path:
-        if 'avg_kmer_coverage' in dfsummary.columns:
-            df_simple_summary = dfsummary[['sample', 'subtype', 'avg_kmer_coverage', 'qc_status', 'qc_message']]
-        else:
-            df_simple_summary = dfsummary[['sample', 'subtype', 'qc_status', 'qc_message']]
-
-        if df_md is not None:
-            df_simple_summary = merge_results_with_metadata(df_simple_summary, df_md)
-
+        df_simple_summary = simple_summary(dfsummary, summary_columns, df_md)
         df_simple_summary.to_csv(output_simple_summary_path, **kwargs_for_pd_to_table)
         if args.json:
             df_simple_summary.to_json(JSON_EXT_TMPL.format(output_simple_summary_path), **kwargs_for_pd_to_json)
@@ -31,16 +31,14 @@ def read_metadata_table(path: str) -> Optional[pd.DataFrame]:
     _, file_ext = os.path.splitext(os.path.basename(path))
     file_ext = file_ext.lower()
     if file_ext not in FILE_EXT_TO_PD_READ_FUNC:
-        logging.error('File extension of metadata file "{}" not one of the expected "{}"'.format(
-            path,
-            list(FILE_EXT_TO_PD_READ_FUNC.keys())
-        ))
+        logging.error('File extension of metadata file "%s" not one of the expected "%s"',
+                      path,
+                      list(FILE_EXT_TO_PD_READ_FUNC.keys()))
         return None
-    dfmd: pd.DataFrame = FILE_EXT_TO_PD_READ_FUNC[file_ext](path)
+    dfmd: pd.DataFrame = FILE_EXT_TO_PD_READ_FUNC[file_ext](path, dtype={'subtype': str})
     assert np.any(dfmd.columns == 'subtype'), 'Column with name "subtype" expected in metadata file "{}"'.format(path)
-    dfmd.subtype.fillna('#N/A', inplace=True)
-    dfmd.subtype = dfmd.subtype.astype(str)
-    logging.info('Read scheme metadata file "{}" into DataFrame with shape {}'.format(path, dfmd.shape))
+    dfmd['subtype'] = dfmd['subtype'].fillna('#N/A')
+    logging.info('Read scheme metadata file "%s" into DataFrame with shape %s', path, dfmd.shape)
     return dfmd
 
 
@@ -12,7 +12,8 @@ from ..qc.checks import \
     is_missing_downstream_targets, \
     is_missing_hierarchical_kmers, \
     is_overall_coverage_low
-from ..qc.const import QC
+from ..qc.const import FAIL, NO_SUBTYPE_RESULT, PASS, WARNING
+from ..qc.const import QC  # noqa: F401 re-exported for backwards compatibility
 from ..subtype import Subtype
 from ..subtyping_params import SubtypingParams
 
@@ -42,9 +43,9 @@ def perform_quality_check(st: Subtype, df: DataFrame, subtyping_params: Subtypin
     """
     if st.subtype is None or len(st.subtype) == 0 \
             or df is None or df.shape[0] == 0:
-        return QC.FAIL, QC.NO_SUBTYPE_RESULT
+        return FAIL, NO_SUBTYPE_RESULT
 
-    overall_qc_status = QC.PASS
+    overall_qc_status = PASS
     messages = []
     for func in CHECKS:
         status, message = func(st, df, subtyping_params)
@@ -52,12 +53,12 @@ def perform_quality_check(st: Subtype, df: DataFrame, subtyping_params: Subtypin
         if status is None:
             continue
         messages.append('{}: {}'.format(status, message))
-        if overall_qc_status == QC.FAIL:
+        if overall_qc_status == FAIL:
             continue
-        if status == QC.FAIL:
-            overall_qc_status = QC.FAIL
+        if status == FAIL:
+            overall_qc_status = FAIL
             continue
-        if status == QC.WARNING:
-            overall_qc_status = QC.WARNING
+        if status == WARNING:
+            overall_qc_status = WARNING
 
     return overall_qc_status, ' | '.join(messages)
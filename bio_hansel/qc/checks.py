@@ -4,7 +4,7 @@ from typing import Tuple, Optional
 
 import pandas as pd
 
-from ..qc.const import QC
+from ..qc.const import AMBIGUOUS_RESULTS_ERROR_3, FAIL, UNCONFIDENT_RESULTS_ERROR_4, WARNING
 from ..qc.utils import get_conflicting_kmers, get_num_pos_neg_kmers, get_mixed_subtype_kmer_counts
 from ..subtype import Subtype
 from ..subtyping_params import SubtypingParams
@@ -17,9 +17,9 @@ def is_overall_coverage_low(st: Subtype, df: pd.DataFrame, p: SubtypingParams) -
         return None, None
 
     if st.avg_kmer_coverage < p.min_coverage_warning:
-        return QC.WARNING, f'Low coverage for all kmers ' \
-                           f'({st.avg_kmer_coverage:.3f} < {p.min_coverage_warning} ' \
-                           f'expected)'
+        return WARNING, f'Low coverage for all kmers ' \
+                        f'({st.avg_kmer_coverage:.3f} < {p.min_coverage_warning} ' \
+                        f'expected)'
     return None, None
 
 
@@ -69,7 +69,7 @@ def is_missing_kmers(st: Subtype, df: pd.DataFrame, p: SubtypingParams) -> Tuple
 
             message_list.append(curr_messages)
         error_messages = ' | '.join(filter(None.__ne__, message_list))
-        return QC.FAIL, error_messages
+        return FAIL, error_messages
 
 
 def check_for_missing_kmers(is_fastq: bool,
@@ -101,7 +101,7 @@ def check_for_missing_kmers(is_fastq: bool,
     # proportion of missing kmers
     p_missing: float = (exp - obs) / exp
     if p_missing > p.max_perc_missing_kmers:
-        status = QC.FAIL
+        status = FAIL
         if is_fastq:
             kmers_with_hits: pd.DataFrame = df[df['is_kmer_freq_okay']]
             depth = kmers_with_hits['freq'].mean()
@@ -140,15 +140,15 @@ def is_mixed_subtype(st: Subtype, df: pd.DataFrame, *args) -> Tuple[Optional[str
         None, None if not mixed subtype result; otherwise, "FAIL", error message
     """
     if not st.are_subtypes_consistent:
-        return QC.FAIL, f'Mixed subtypes found: "{"; ".join(sorted(st.inconsistent_subtypes))}".'
+        return FAIL, f'Mixed subtypes found: "{"; ".join(sorted(st.inconsistent_subtypes))}".'
     conflicting_kmers = get_conflicting_kmers(st.subtype, df, st.is_fastq_input())
     if conflicting_kmers is None or conflicting_kmers.shape[0] == 0:
         return None, None
 
     s = 's' if conflicting_kmers.shape[0] > 1 else ''
     positions = ', '.join(conflicting_kmers['refposition'].astype(str).tolist())
-    return QC.FAIL, f'Mixed subtype; the positive and negative kmers were found for ' \
-                    f'the same target site{s} {positions} for subtype "{st.subtype}".'
+    return FAIL, f'Mixed subtype; the positive and negative kmers were found for ' \
+                 f'the same target site{s} {positions} for subtype "{st.subtype}".'
 
 
 def is_missing_too_many_target_sites(st: Subtype,
@@ -180,8 +180,8 @@ def is_missing_too_many_target_sites(st: Subtype,
     exp = int(st.n_kmers_matching_all_expected)
     obs = int(st.n_kmers_matching_all)
     if (exp - obs) / exp <= p.max_perc_missing_kmers and len(missing_targets) >= p.min_ambiguous_kmers:
-        return QC.FAIL, f'{QC.AMBIGUOUS_RESULTS_ERROR_3}: There were {len(missing_targets)} missing positions for ' \
-                        f'subtype "{st.subtype}".'
+        return FAIL, f'{AMBIGUOUS_RESULTS_ERROR_3}: There were {len(missing_targets)} missing positions for ' \
+                     f'subtype "{st.subtype}".'
     return None, None
 
 
@@ -201,9 +201,9 @@ def is_missing_downstream_targets(st: Subtype, *args) -> Tuple[Optional[str], Op
         None, None if no missing downstream targets; otherwise, "FAIL", error message
     """
     if st.non_present_subtypes:
-        return QC.FAIL, f'{QC.UNCONFIDENT_RESULTS_ERROR_4}: Subtype "{st.subtype}" was found, but kmers for ' \
-                        f'downstream subtype(s) "{st.non_present_subtypes}" were missing. Due to missing downstream ' \
-                        f'kmers, there is a lack of confidence in the final subtype call.'
+        return FAIL, f'{UNCONFIDENT_RESULTS_ERROR_4}: Subtype "{st.subtype}" was found, but kmers for ' \
+                     f'downstream subtype(s) "{st.non_present_subtypes}" were missing. Due to missing downstream ' \
+                     f'kmers, there is a lack of confidence in the final subtype call.'
     return None, None
 
 
@@ -225,9 +225,9 @@ def is_missing_hierarchical_kmers(st: Subtype, *args) -> Tuple[Optional[str], Op
         None, None if no missing downstream targets; otherwise, "FAIL", error message
     """
     if st.missing_nested_subtypes:
-        return QC.FAIL, f'{QC.UNCONFIDENT_RESULTS_ERROR_4}: Subtype "{st.subtype}" was found, but kmers for ' \
-                        f'nested hierarchical subtype(s) "{st.missing_nested_subtypes}" were missing. Due to missing ' \
-                        f'kmers, there is a lack of confidence in the final subtype call.'
+        return FAIL, f'{UNCONFIDENT_RESULTS_ERROR_4}: Subtype "{st.subtype}" was found, but kmers for ' \
+                     f'nested hierarchical subtype(s) "{st.missing_nested_subtypes}" were missing. Due to missing ' \
+                     f'kmers, there is a lack of confidence in the final subtype call.'
     return None, None
 
 
@@ -263,7 +263,7 @@ def is_maybe_intermediate_subtype(st: Subtype,
     exp = int(st.n_kmers_matching_all_expected)
     if (exp - obs) / exp <= p.max_perc_intermediate_kmers and conflicting_kmers.shape[0] == 0 and \
             total_subtype_kmers_hits < total_subtype_kmers and num_pos_kmers and num_neg_kmers:
-        return QC.WARNING, f'Possible intermediate subtype. All scheme kmers were found, but a fraction ' \
-                           f'were positive for the final subtype. Total subtype matches observed ' \
-                           f'(n={total_subtype_kmers_hits}) vs expected (n={total_subtype_kmers})'
+        return WARNING, f'Possible intermediate subtype. All scheme kmers were found, but a fraction ' \
+                        f'were positive for the final subtype. Total subtype matches observed ' \
+                        f'(n={total_subtype_kmers_hits}) vs expected (n={total_subtype_kmers})'
     return None, None
@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
 
+FAIL = 'FAIL'
+WARNING = 'WARNING'
+PASS = 'PASS'
+AMBIGUOUS_RESULTS_ERROR_3 = 'Ambiguous Results Error 3'
+UNCONFIDENT_RESULTS_ERROR_4 = 'Inconclusive Results Error 4'
+NO_SUBTYPE_RESULT = 'No subtype result!'
+NO_TARGETS_FOUND = 'No kmers/targets were found in this sample.'
+
+
 class QC:
-    FAIL = 'FAIL'
-    WARNING = 'WARNING'
-    PASS = 'PASS'
-    AMBIGUOUS_RESULTS_ERROR_3 = 'Ambiguous Results Error 3'
-    UNCONFIDENT_RESULTS_ERROR_4 = 'Inconclusive Results Error 4'
-    NO_SUBTYPE_RESULT = 'No subtype result!'
-    NO_TARGETS_FOUND = 'No kmers/targets were found in this sample.'
+    """QC status and message constants namespace
+
+    Kept for backwards compatibility; prefer the module-level constants in per-sample QC code.
+    """
+    FAIL = FAIL
+    WARNING = WARNING
+    PASS = PASS
+    AMBIGUOUS_RESULTS_ERROR_3 = AMBIGUOUS_RESULTS_ERROR_3
+    UNCONFIDENT_RESULTS_ERROR_4 = UNCONFIDENT_RESULTS_ERROR_4
+    NO_SUBTYPE_RESULT = NO_SUBTYPE_RESULT
+    NO_TARGETS_FOUND = NO_TARGETS_FOUND
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
 import re
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Set
 
 import attr
@@ -64,6 +66,22 @@ def _kmers(kmers_fasta: str) -> (Dict[str, List[str]], Dict[str, List[str]], Set
 
 
 def subtype_counts(scheme_fasta: str) -> Dict[str, SubtypeCounts]:
+    """Summarize the number of subtype specific, positive and negative kmers for each subtype in a scheme
+
+    Results are memoized per scheme FASTA path and modification time so that repeated subtyping runs within the same
+    process only parse the scheme once. The returned dict is shared between callers and should not be modified.
+
+    Args:
+        scheme_fasta: bio_hansel scheme FASTA path
+
+    Returns:
+        dict of subtype to SubtypeCounts
+    """
+    return _subtype_counts(scheme_fasta, os.stat(scheme_fasta).st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _subtype_counts(scheme_fasta: str, mtime_ns: int) -> Dict[str, SubtypeCounts]:
     subtype_counts = {}
     kmers, neg_kmers, sizes = _kmers(scheme_fasta)
     if len(sizes) > 1:
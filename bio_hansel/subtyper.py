@@ -8,9 +8,10 @@ from typing import Optional, List, Dict, Union, Tuple, Set
 
 import pandas as pd
 
-from .aho_corasick import init_automaton, find_in_fasta, find_in_fastqs
+from .aho_corasick import get_automaton, find_in_fasta, find_in_fastqs
 from .const import COLUMNS_TO_REMOVE
-from .qc import perform_quality_check, QC
+from .qc import perform_quality_check
+from .qc.const import FAIL, NO_TARGETS_FOUND
 from .subtype import Subtype
 from .subtype_stats import SubtypeCounts
 from .subtype_stats import subtype_counts
@@ -18,6 +19,51 @@ from .subtyping_params import SubtypingParams
 from .utils import find_inconsistent_subtypes, get_scheme_fasta, get_scheme_version, init_subtyping_params
 
 
+def subtype_samples(input_genomes: List[Tuple[str, str]],
+                    reads: List[Tuple[List[str], str]],
+                    scheme: str,
+                    scheme_name: Optional[str] = None,
+                    subtyping_params: Optional[SubtypingParams] = None,
+                    scheme_subtype_counts: Optional[Dict[str, SubtypeCounts]] = None,
+                    n_threads: int = 1) -> List[Tuple[Subtype, pd.DataFrame]]:
+    """Subtype input contigs and reads genomes using a scheme.
+
+    Args:
+        input_genomes: input contigs genomes; tuple of FASTA file path and genome name
+        reads: input reads genomes; tuple of list of FASTQ file paths and genome name
+        scheme: bio_hansel scheme FASTA path
+        scheme_name: optional scheme name
+        subtyping_params: scheme specific subtyping parameters
+        scheme_subtype_counts: summary information about scheme
+        n_threads: number of threads to use for subtyping analysis
+
+    Returns:
+        List of tuple of Subtype and detailed subtyping results for each contigs sample followed by each reads sample
+    """
+    if n_threads == 1:
+        outputs = []
+        if input_genomes:
+            outputs += subtype_contigs_samples(input_genomes=input_genomes,
+                                               scheme=scheme,
+                                               scheme_name=scheme_name,
+                                               subtyping_params=subtyping_params,
+                                               scheme_subtype_counts=scheme_subtype_counts)
+        if reads:
+            outputs += subtype_reads_samples(reads=reads,
+                                             scheme=scheme,
+                                             scheme_name=scheme_name,
+                                             subtyping_params=subtyping_params,
+                                             scheme_subtype_counts=scheme_subtype_counts)
+        return outputs
+    return parallel_query_samples(input_genomes=input_genomes,
+                                  reads=reads,
+                                  scheme=scheme,
+                                  scheme_name=scheme_name,
+                                  subtyping_params=subtyping_params,
+                                  scheme_subtype_counts=scheme_subtype_counts,
+                                  n_threads=n_threads)
+
+
 def subtype_reads_samples(reads: List[Tuple[List[str], str]],
                           scheme: str,
                           scheme_name: Optional[str] = None,
@@ -123,13 +169,13 @@ def subtype_contigs(fasta_path: str,
                  scheme_version=scheme_version,
                  scheme_subtype_counts=scheme_subtype_counts)
 
-    automaton = init_automaton(scheme_fasta)
+    automaton = get_automaton(scheme_fasta)
     df = find_in_fasta(automaton, fasta_path)
 
     if df is None or df.shape[0] == 0:
         logging.warning('No subtyping kmer matches for input "%s" for scheme "%s"', fasta_path, scheme)
-        st.qc_status = QC.FAIL
-        st.qc_message = QC.NO_TARGETS_FOUND
+        st.qc_status = FAIL
+        st.qc_message = NO_TARGETS_FOUND
         st.are_subtypes_consistent = False
         return st, empty_results(st)
 
@@ -226,6 +272,56 @@ def parallel_query_reads(reads: List[Tuple[List[str], str]],
     return [x.get() for x in res]
 
 
+def parallel_query_samples(input_genomes: List[Tuple[str, str]],
+                           reads: List[Tuple[List[str], str]],
+                           scheme: str,
+                           scheme_name: Optional[str] = None,
+                           subtyping_params: Optional[SubtypingParams] = None,
+                           scheme_subtype_counts: Optional[Dict[str, SubtypeCounts]] = None,
+                           n_threads: int = 1) -> List[Tuple[Subtype, pd.DataFrame]]:
+    """Parallel subtyping of input contigs and reads
+
+    Subtype and analyse each input in parallel using a single multiprocessing thread pool shared by contigs and reads
+    inputs so that workers are not left idle waiting for all contigs inputs to finish before reads inputs are started.
+
+    Args:
+        input_genomes: Input genome FASTA paths; list of tuples of FASTA file path and genome name
+        reads: Input reads; list of tuples of FASTQ file paths and genome names
+        scheme: bio_hansel scheme FASTA path
+        scheme_name: optional scheme name
+        subtyping_params: scheme specific subtyping parameters
+        scheme_subtype_counts: scheme summary information
+        n_threads: number of threads to use
+
+    Returns:
+        A list of tuples of Subtype results and a pd.DataFrame of detailed subtyping results for each contigs input
+        followed by each reads input
+    """
+    from multiprocessing import Pool
+    logging.info('Initializing thread pool with %s threads', n_threads)
+    with Pool(processes=n_threads) as pool:
+        logging.info('Running analysis asynchronously on %s contigs and %s reads input genomes',
+                     len(input_genomes),
+                     len(reads))
+        res = [pool.apply_async(subtype_contigs, (input_fasta,
+                                                  genome_name,
+                                                  scheme,
+                                                  subtyping_params,
+                                                  scheme_name,
+                                                  scheme_subtype_counts))
+               for input_fasta, genome_name in input_genomes]
+        res += [pool.apply_async(subtype_reads, (fastqs,
+                                                 genome_name,
+                                                 scheme,
+                                                 scheme_name,
+                                                 subtyping_params,
+                                                 scheme_subtype_counts))
+                for fastqs, genome_name in reads]
+        outputs = [x.get() for x in res]
+    logging.info('Parallel analysis complete! Retrieved %s analysis results', len(outputs))
+    return outputs
+
+
 def get_kmer_fraction(row):
     """Calculate the percentage frequency of a given position
 
@@ -289,7 +385,7 @@ def subtype_reads(reads: Union[str, List[str]],
                  scheme_version=scheme_version,
                  scheme_subtype_counts=scheme_subtype_counts)
 
-    automaton = init_automaton(scheme_fasta)
+    automaton = get_automaton(scheme_fasta)
     if isinstance(reads, str):
         df = find_in_fastqs(automaton, reads)
     elif isinstance(reads, list):
@@ -300,8 +396,8 @@ def subtype_reads(reads: Union[str, List[str]],
     if df is None or df.shape[0] == 0:
         logging.warning('No subtyping kmer matches for input "%s" for scheme "%s"', reads, scheme)
         st.are_subtypes_consistent = False
-        st.qc_status = QC.FAIL
-        st.qc_message = QC.NO_TARGETS_FOUND
+        st.qc_status = FAIL
+        st.qc_message = NO_TARGETS_FOUND
         return st, empty_results(st)
 
     refpositions = [x for x, y in df.kmername.str.split('-')]
@@ -16,6 +16,6 @@ class SubtypingParams(object):
 
     @max_perc_missing_kmers.validator
     def _validate_max_perc_missing_kmers(self, attribute, value):
-        if 0.0 > value > 1.0:
+        if not 0.0 <= value <= 1.0:
             raise AttributeError(f'Max % misssing kmers was {value} expected '
                                  f'to be decimal between 0.0 and 1.0 inclusive')
@@ -21,7 +21,7 @@ def does_file_exist(filepath: str, force: bool):
             msg = f'File "{filepath}" already exists! If you want to overwrite this output file run with opt "--force"'
             raise OSError(msg)
         else:
-            logging.warning(f'File "{filepath}" already exists, overwriting with "--force"')
+            logging.warning('File "%s" already exists, overwriting with "--force"', filepath)
 
 
 def genome_name_from_fasta_path(fasta_path: str) -> str:
@@ -208,12 +208,24 @@ def init_subtyping_params(args: Optional[argparse.Namespace] = None,
 
 
 def df_field_fillna(df: pd.DataFrame, field: str = 'subtype', na: str = '#N/A') -> pd.DataFrame:
-    df[field].replace('', na, inplace=True)
-    df[field].fillna(value=na, inplace=True)
-    df[field] = df[field].astype(str)
+    df[field] = df[field].replace('', na).fillna(value=na).astype(str)
     return df
 
 
+def check_kmer_freq_thresholds(subtyping_params: SubtypingParams):
+    """Checks that the min k-mer frequency threshold does not exceed the max k-mer frequency threshold
+
+    Args:
+        subtyping_params: Subtyping parameters
+
+    Raises:
+        ValueError if the min k-mer frequency is greater than the max k-mer frequency
+    """
+    if subtyping_params.min_kmer_freq > subtyping_params.max_kmer_freq:
+        raise ValueError(f'Min k-mer freq/coverage ({subtyping_params.min_kmer_freq}) cannot be greater than '
+                         f'max k-mer freq/coverage ({subtyping_params.max_kmer_freq})')
+
+
 def check_total_kmers(scheme_fasta, max_degenerate_kmers):
     """Checks that the number of kmers about to be created is not at too high a computation or time cost
 
@@ -3,6 +3,7 @@
 import numpy as np
 import pandas as pd
 
+from bio_hansel.main import simple_summary
 from bio_hansel.metadata import read_metadata_table, merge_results_with_metadata
 from bio_hansel.utils import df_field_fillna
 
@@ -39,3 +40,29 @@ def test_read_metadata_with_na_subtype():
                 assert row[column] == column + row['subtype']
             else:
                 assert row[column] == column, f'row={row}'
+
+
+def test_read_metadata_subtypes_as_strings(tmp_path):
+    md_path = tmp_path / 'metadata.tsv'
+    md_path.write_text('subtype\ta\n1.10\ta1.10\n1.1\ta1.1\n')
+    df_md = read_metadata_table(str(md_path))
+    assert list(df_md['subtype']) == ['1.10', '1.1']
+
+
+def test_simple_summary_with_colliding_metadata_columns():
+    df_results = pd.read_table('tests/data/subtyping-results.tsv')
+    df_results = df_field_fillna(df_results)
+    df_md = pd.DataFrame({'subtype': ['1.1', '2.2.1.1.1.1'],
+                          'scheme_version': ['md1', 'md2'],
+                          'qc_status': ['a', 'b'],
+                          'note': ['n1', 'n2']})
+    summary_columns = list(df_results.columns)
+    df_merged = merge_results_with_metadata(df_results, df_md)
+    df_simple = simple_summary(df_merged, summary_columns, df_md)
+    simple_cols = ['sample', 'subtype', 'qc_status', 'qc_message']
+    if 'avg_kmer_coverage' in summary_columns:
+        simple_cols.insert(2, 'avg_kmer_coverage')
+    df_expected = merge_results_with_metadata(df_results[simple_cols], df_md)
+    assert list(df_simple.columns) == list(df_expected.columns)
+    assert 'scheme_version' in df_simple.columns
+    pd.testing.assert_frame_equal(df_simple, df_expected)
@@ -1,14 +1,22 @@
 # -*- coding: utf-8 -*-
 
+import json
+import os
+import shutil
+
 import pandas as pd
 import pytest
 
+from bio_hansel.aho_corasick import get_automaton
+from bio_hansel.main import init_parser, kmer_results_tables, write_tables
 from bio_hansel.qc import QC
 from bio_hansel.subtype import Subtype
-from bio_hansel.subtype_stats import SubtypeCounts
+from bio_hansel.subtype_stats import SubtypeCounts, subtype_counts
 from bio_hansel.subtyper import absent_downstream_subtypes, sorted_subtype_ints, empty_results, \
-    get_missing_internal_subtypes
-from bio_hansel.utils import find_inconsistent_subtypes, expand_degenerate_bases
+    get_missing_internal_subtypes, subtype_contigs, subtype_reads
+from bio_hansel.subtyping_params import SubtypingParams
+from bio_hansel.utils import find_inconsistent_subtypes, expand_degenerate_bases, get_scheme_fasta, \
+    init_subtyping_params, check_kmer_freq_thresholds, df_field_fillna
 
 
 def test_absent_downstream_subtypes():
@@ -149,3 +157,107 @@ def test_expand_degenerate_bases():
     assert len(expand_degenerate_bases('NNNNN')) == 1024
     with open('tests/data/expand_degenerate_bases_DARTHVADR.txt') as f:
         assert expand_degenerate_bases('DARTHVADR') == f.read().split('\n')
+
+
+def test_subtype_counts_memoized():
+    scheme_fasta = get_scheme_fasta('heidelberg')
+    counts = subtype_counts(scheme_fasta)
+    assert subtype_counts(scheme_fasta) is counts
+    assert counts['2.2.2.2.1.4'].subtype_kmer_count == 3
+
+
+def test_get_automaton_cached_on_mtime(tmp_path):
+    scheme_fasta = str(tmp_path / 'kmers.fasta')
+    shutil.copy(get_scheme_fasta('heidelberg'), scheme_fasta)
+    automaton = get_automaton(scheme_fasta)
+    assert get_automaton(scheme_fasta) is automaton
+    stat = os.stat(scheme_fasta)
+    os.utime(scheme_fasta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert get_automaton(scheme_fasta) is not automaton
+
+
+def test_subtyping_params_max_perc_missing_kmers_range():
+    with pytest.raises(AttributeError):
+        SubtypingParams(max_perc_missing_kmers=1.5)
+    assert SubtypingParams(max_perc_missing_kmers=1.0).max_perc_missing_kmers == 1.0
+
+
+def test_check_kmer_freq_thresholds():
+    args = init_parser().parse_args(['--min-kmer-freq', '100', '--max-kmer-freq', '10', 'genome.fasta'])
+    with pytest.raises(ValueError):
+        check_kmer_freq_thresholds(init_subtyping_params(args))
+    args = init_parser().parse_args(['--min-kmer-freq', '10', '--max-kmer-freq', '100', 'genome.fasta'])
+    check_kmer_freq_thresholds(init_subtyping_params(args))
+
+
+@pytest.mark.parametrize('argv', [
+    ['--min-kmer-frac', '1.5'],
+    ['--max-missing-kmers', '-0.1'],
+    ['--max-intermediate-kmers', '1.01'],
+    ['--min-kmer-freq', '-1'],
+    ['-t', '0'],
+    ['--min-kmer-frac', 'abc'],
+    ['--max-kmer-freq', '1.5'],
+    ['-t', 'two'],
+])
+def test_parse_args_rejects_invalid_numbers(argv):
+    with pytest.raises(SystemExit):
+        init_parser().parse_args(argv + ['genome.fasta'])
+
+
+def test_parse_args_accepts_range_boundaries():
+    args = init_parser().parse_args(['--min-kmer-frac', '0.0',
+                                     '--max-missing-kmers', '1.0',
+                                     '--max-intermediate-kmers', '0',
+                                     '--min-kmer-freq', '0',
+                                     '-t', '1',
+                                     'genome.fasta'])
+    assert args.min_kmer_frac == 0.0
+    assert args.max_missing_kmers == 1.0
+    assert args.max_intermediate_kmers == 0.0
+    assert args.min_kmer_freq == 0
+    assert args.threads == 1
+
+
+def test_kmer_results_tables(tmp_path):
+    _, df_contigs = subtype_contigs(fasta_path='tests/data/SRR1002850_SMALL.fasta',
+                                    genome_name='contigs',
+                                    scheme='heidelberg')
+    _, df_reads = subtype_reads(reads='tests/data/SRR5646583_SMALL.fastq',
+                                genome_name='reads',
+                                scheme='heidelberg')
+    dfs = [df_contigs, df_reads]
+    dfall = pd.concat([df.sort_values('is_pos_kmer', ascending=False) for df in dfs], sort=False)
+    dfall = df_field_fillna(dfall.drop(columns=['qc_message']))
+    tables = list(kmer_results_tables(dfs))
+    assert len(tables) == 2
+    for df in tables:
+        assert list(df.columns) == list(dfall.columns)
+    kwargs_for_pd_to_table = dict(sep='\t', index=None, float_format='%.3f')
+    exp_path = tmp_path / 'expected.tsv'
+    dfall.to_csv(exp_path, **kwargs_for_pd_to_table)
+    path = tmp_path / 'kmer_results.tsv'
+    with open(path, 'w') as fh:
+        for i, df in enumerate(tables):
+            df.to_csv(fh, header=(i == 0), **kwargs_for_pd_to_table)
+    pd.testing.assert_frame_equal(pd.read_table(path), pd.read_table(exp_path), check_dtype=False)
+
+
+def test_write_tables_json_records(tmp_path):
+    columns = ['kmername', 'refposition', 'freq', 'is_pos_kmer']
+    df_empty = pd.DataFrame(columns=columns)
+    df_a = pd.DataFrame([['1-1', 1, 10, True], ['negative2-2', 2, None, False]], columns=columns)
+    df_b = pd.DataFrame([['3-1.1', 3, 5, True]], columns=columns)
+    dfs = [df_empty, df_a, df_empty, df_b]
+    path = tmp_path / 'kmer_results.tsv'
+    json_path = tmp_path / 'kmer_results.tsv.json'
+    write_tables(dfs, str(path), str(json_path), sep='\t', index=None)
+    dfall = pd.concat(dfs, ignore_index=True, sort=False)
+    with open(json_path) as fh:
+        assert json.load(fh) == json.loads(dfall.to_json(orient='records'))
+    exp_path = tmp_path / 'expected.tsv'
+    dfall.to_csv(exp_path, sep='\t', index=None)
+    pd.testing.assert_frame_equal(pd.read_table(path), pd.read_table(exp_path))
+    write_tables([df_empty], str(path), str(json_path), sep='\t', index=None)
+    with open(json_path) as fh:
+        assert json.load(fh) == []
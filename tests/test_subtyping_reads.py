@@ -4,8 +4,9 @@ from pandas import DataFrame
 from bio_hansel.const import SCHEME_FASTAS
 from bio_hansel.qc.const import QC
 from bio_hansel.subtype import Subtype
-from bio_hansel.subtyper import subtype_reads, subtype_contigs
-from . import check_df_fastq_cols, check_subtype_attrs
+from bio_hansel.subtyper import subtype_reads, subtype_contigs, subtype_samples
+from bio_hansel.subtyping_params import SubtypingParams
+from . import check_df_fasta_cols, check_df_fastq_cols, check_subtype_attrs
 
 genome_name = 'test'
 scheme_heidelberg = 'heidelberg'
@@ -167,3 +168,29 @@ def test_typhimurium_scheme(subtype_typhimurium_pass):
     assert isinstance(st, Subtype)
     assert isinstance(df, DataFrame)
     check_subtype_attrs(st, subtype_typhimurium_pass)
+
+
+def test_subtype_samples_contigs_and_reads_shared_pool(subtype_heidelberg_SRR1002850_pass, subtype_heidelberg_pass):
+    scheme_name = 'heidelberg-custom'
+    subtype_heidelberg_SRR1002850_pass.scheme = scheme_name
+    subtype_heidelberg_pass.scheme = scheme_name
+    kwargs = dict(input_genomes=[(fasta_heidelberg_pass, genome_name)],
+                  reads=[([fastq_heidelberg_pass], genome_name), ([fastq_gz_heidelberg_pass], genome_name)],
+                  scheme=scheme_heidelberg,
+                  scheme_name=scheme_name,
+                  subtyping_params=SubtypingParams(low_coverage_depth_freq=20))
+    serial_results = subtype_samples(**kwargs)
+    parallel_results = subtype_samples(n_threads=2, **kwargs)
+    assert len(serial_results) == len(parallel_results) == 3
+    # contigs results come first followed by reads results in input order
+    exp_subtypes = [subtype_heidelberg_SRR1002850_pass, subtype_heidelberg_pass, subtype_heidelberg_pass]
+    exp_file_paths = [fasta_heidelberg_pass, [fastq_heidelberg_pass], [fastq_gz_heidelberg_pass]]
+    for (st, df), (st_parallel, df_parallel), st_exp, file_path in zip(serial_results,
+                                                                       parallel_results,
+                                                                       exp_subtypes,
+                                                                       exp_file_paths):
+        check_subtype_attrs(st, st_parallel, st_exp)
+        assert st.file_path == st_parallel.file_path == file_path
+    check_df_fasta_cols(parallel_results[0][1])
+    check_df_fastq_cols(parallel_results[1][1])
+    check_df_fastq_cols(parallel_results[2][1])